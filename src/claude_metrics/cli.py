@@ -1,20 +1,80 @@
 """Command-line interface for claude-metrics."""
 
+import operator
 import os
 import sys
+from collections import deque
+from contextlib import ExitStack
+from dataclasses import replace
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 import click
-from rich.console import Console
-from rich.table import Table
 
-from .config import Config
-from .scanner import ConversationScanner
-from .storage import LocalStorage
-from .patterns import PatternDetector
+# Heavier modules (rich, yaml via config, msgspec via the scanner, and the
+# storage/patterns stack) are imported inside the commands that use them so
+# `--help` and commands that don't need them skip that cost at startup.
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
+    from rich.console import Console
+    from rich.table import Table
+
+    from .config import Config
+    from .patterns import PatternDetector
+    from .scanner import Conversation
 
-console = Console()
+T = TypeVar("T")
+
+_console_instance: Optional["Console"] = None
+
+# Pooled tasks kept in flight per worker process during scan
+_TASKS_PER_JOB = 16
+
+# Per-process state of scan pool workers, installed by _init_scan_worker
+_worker_load: Optional[Callable[[str], Optional["Conversation"]]] = None
+_worker_detector: Optional["PatternDetector"] = None
+
+# Per-repository columns shown by every report format, in display order
+_REPORT_HEADERS = (
+    "Repository",
+    "Conversations",
+    "Errors",
+    "Tool Usage",
+    "Last Activity",
+)
+# Rich column options for the table report, paired with _REPORT_HEADERS
+_REPORT_COLUMN_OPTIONS = (
+    {"style": "cyan"},
+    {"justify": "right"},
+    {"justify": "right", "style": "red"},
+    {"justify": "right", "style": "green"},
+    {"style": "dim"},
+)
+_REPORT_ROW = operator.itemgetter(
+    "conversation_count", "error_count", "tool_usage_count", "last_activity"
+)
+
+
+def _console() -> "Console":
+    """Return the shared Rich console, creating it on first use."""
+    global _console_instance
+    if _console_instance is None:
+        from rich.console import Console
+        
+        _console_instance = Console()
+    return _console_instance
 
 
 @click.group()
@@ -34,6 +94,9 @@ def cli(ctx: click.Context) -> None:
 )
 def init(config_dir: Optional[str]) -> None:
     """Initialize claude-metrics configuration."""
+    from .config import Config
+    
+    console = _console()
     try:
         config = Config.create_default(config_dir)
         console.print(f"✅ Initialized configuration at: {config.config_dir}")
@@ -61,41 +124,92 @@ def init(config_dir: Optional[str]) -> None:
     is_flag=True,
     help="Use local storage only",
 )
-def scan(repository: Optional[str], since: str, local_only: bool) -> None:
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Worker processes; each parses and scans whole conversation files",
+)
+def scan(repository: Optional[str], since: str, local_only: bool, jobs: int) -> None:
     """Scan Claude Code conversations and extract metrics."""
+    from concurrent.futures import ProcessPoolExecutor
+    
+    from rich.progress import Progress
+    
+    from .config import Config
+    from .patterns import PatternDetector
+    from .scanner import ConversationScanner
+    from .storage import LocalStorage
+    
+    console = _console()
     try:
         config = Config.load()
         storage = LocalStorage(config.storage_path)
         scanner = ConversationScanner(config.claude_projects_path)
-        detector = PatternDetector()
+        load = scanner.conversation_loader(repository_filter=repository, since=since)
         
         console.print("🔍 Scanning Claude Code conversations...")
         
-        conversations = scanner.scan_conversations(
-            repository_filter=repository,
-            since=since
-        )
+        found = processed = 0
+        with ExitStack() as stack:
+            # Parsing and detection are CPU-bound, so whole files go to worker
+            # processes; storage writes stay on this process to keep a single
+            # database writer.
+            files = scanner.iter_conversation_files()
+            if jobs > 1:
+                # Each worker builds its detector once; tasks carry only a path
+                executor = stack.enter_context(
+                    ProcessPoolExecutor(
+                        max_workers=jobs,
+                        initializer=_init_scan_worker,
+                        initargs=(load,),
+                    )
+                )
+                results = _map_bounded(
+                    executor,
+                    _process_conversation_file_pooled,
+                    files,
+                    window=jobs * _TASKS_PER_JOB,
+                )
+            else:
+                process = partial(_process_conversation_file, load, PatternDetector())
+                results = ((file_path, process(file_path)) for file_path in files)
+                
+            # Progress repaints in place at a capped refresh rate; the total
+            # is unknown because files are processed as they are discovered.
+            # It starts on the first conversation so an empty scan draws no bar.
+            progress = None
+            for _, result in results:
+                if result is None:
+                    continue
+                conversation, patterns, error = result
+                found += 1
+                if progress is None:
+                    progress = stack.enter_context(Progress(console=console))
+                    task = progress.add_task("⏳ Processing conversations", total=None)
+                progress.advance(task)
+                if error is None:
+                    try:
+                        storage.store_conversation_metrics(conversation, patterns)
+                        processed += 1
+                        continue
+                    except Exception as e:
+                        error = str(e)
+                        
+                console.print(
+                    f"⚠️  Error processing conversation {conversation.session_id}: "
+                    f"{error}"
+                )
         
-        if not conversations:
+        if not found:
             console.print("📭 No conversations found")
             return
             
-        console.print(f"📄 Found {len(conversations)} conversations")
-        
-        processed = 0
-        for conversation in conversations:
-            try:
-                patterns = detector.detect_patterns(conversation)
-                storage.store_conversation_metrics(conversation, patterns)
-                processed += 1
-                
-                if processed % 10 == 0:
-                    console.print(f"⏳ Processed {processed}/{len(conversations)} conversations")
-                    
-            except Exception as e:
-                console.print(f"⚠️  Error processing conversation {conversation.session_id}: {e}")
-                continue
-        
+        if processed:
+            _save_cached_metrics(config, storage.get_repository_metrics())
+            
         console.print(f"✅ Successfully processed {processed} conversations")
         console.print("📊 Run 'claude-metrics report' to view insights")
         
@@ -107,6 +221,158 @@ def scan(repository: Optional[str], since: str, local_only: bool) -> None:
         sys.exit(1)
 
 
+def _map_bounded(
+    executor: "Executor",
+    fn: Callable[[T], Any],
+    items: Iterable[T],
+    window: int,
+) -> Iterator[Tuple[T, Any]]:
+    """Yield (item, fn(item)) in input order with at most ``window`` tasks in flight.
+    
+    Unlike Executor.map, which submits every item before yielding, this pulls
+    from ``items`` only as earlier results are consumed, so a streamed input
+    stays streamed.
+    """
+    pending: Deque[Tuple[T, "Future"]] = deque()
+    for item in items:
+        if len(pending) >= window:
+            done, future = pending.popleft()
+            yield done, future.result()
+        pending.append((item, executor.submit(fn, item)))
+        
+    while pending:
+        done, future = pending.popleft()
+        yield done, future.result()
+
+
+def _process_conversation_file(
+    load: Callable[[str], Optional["Conversation"]],
+    detector: "PatternDetector",
+    file_path: str,
+) -> Optional[Tuple["Conversation", Any, Optional[str]]]:
+    """Load, filter and run pattern detection on one conversation file.
+    
+    Returns None for files that are skipped.
+    """
+    conversation = load(file_path)
+    if conversation is None:
+        return None
+    patterns, error = _detect_patterns(detector, conversation)
+    return conversation, patterns, error
+
+
+def _init_scan_worker(load: Callable[[str], Optional["Conversation"]]) -> None:
+    """Pool initializer: set up the loader and pattern detector once per worker."""
+    from .patterns import PatternDetector
+    
+    global _worker_load, _worker_detector
+    _worker_load = load
+    _worker_detector = PatternDetector()
+
+
+def _process_conversation_file_pooled(
+    file_path: str,
+) -> Optional[Tuple["Conversation", Any, Optional[str]]]:
+    """_process_conversation_file for pool workers under --jobs.
+    
+    Sends back a metadata record rather than the full transcript: every
+    conversation and message field is kept except the message text, which
+    pattern detection has already consumed in the worker.
+    """
+    result = _process_conversation_file(_worker_load, _worker_detector, file_path)
+    if result is None:
+        return None
+    conversation, patterns, error = result
+    messages = [replace(message, content="") for message in conversation.messages]
+    return replace(conversation, messages=messages), patterns, error
+
+
+def _detect_patterns(
+    detector: "PatternDetector", conversation: "Conversation"
+) -> Tuple[Any, Optional[str]]:
+    """Run pattern detection, returning any error as a message instead of raising.
+    
+    Keeps one bad conversation from aborting the whole scan. The error is a
+    string because exceptions don't always survive pickling, and one that
+    fails to unpickle in the parent breaks the process pool.
+    """
+    try:
+        return detector.detect_patterns(conversation), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def _metrics_cache_path(config: "Config") -> Path:
+    """Location of the repository metrics snapshot written after each scan."""
+    return config.config_dir / "aggregates.json"
+
+
+def _storage_signature(storage_path: Path) -> Optional[dict]:
+    """Identify the database's current state, or None if it doesn't exist.
+    
+    Records the path plus (st_size, st_mtime_ns) of the database and its WAL
+    file; the WAL is None when absent.
+    """
+    signature: dict = {"storage_path": str(storage_path)}
+    wal_path = storage_path.with_name(storage_path.name + "-wal")
+    for key, path in (("db", storage_path), ("wal", wal_path)):
+        try:
+            st = path.stat()
+        except OSError:
+            if key == "db":
+                return None
+            signature[key] = None
+        else:
+            signature[key] = [st.st_size, st.st_mtime_ns]
+    return signature
+
+
+def _save_cached_metrics(config: "Config", metrics: dict) -> None:
+    """Snapshot repository metrics so report can skip the storage aggregation."""
+    import json
+    
+    signature = _storage_signature(config.storage_path)
+    if signature is None:
+        return
+        
+    cache_path = _metrics_cache_path(config)
+    tmp_path = cache_path.with_suffix(".tmp")
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump({"storage": signature, "metrics": metrics}, f, default=str)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # The snapshot is only an optimization; report falls back to storage
+        pass
+
+
+def _load_cached_metrics(config: "Config") -> Optional[dict]:
+    """Return the last scan's metrics snapshot, or None if missing or stale.
+    
+    The snapshot is only used while the database path, size and mtime (and
+    those of its WAL) exactly match what was recorded when it was written. A
+    missing database always counts as stale.
+    """
+    signature = _storage_signature(config.storage_path)
+    if signature is None:
+        return None
+        
+    try:
+        from orjson import loads
+    except ImportError:
+        from json import loads
+        
+    try:
+        with open(_metrics_cache_path(config), "rb") as f:
+            snapshot = loads(f.read())
+    except (OSError, ValueError):
+        return None
+        
+    if not isinstance(snapshot, dict) or snapshot.get("storage") != signature:
+        return None
+    return snapshot.get("metrics")
+
+
 @cli.command()
 @click.option(
     "--format",
@@ -121,17 +387,22 @@ def scan(repository: Optional[str], since: str, local_only: bool) -> None:
 )
 def report(format: str, repository: Optional[str]) -> None:
     """Generate metrics report."""
+    from .config import Config
+    from .storage import LocalStorage
+    
+    console = _console()
     try:
         config = Config.load()
-        storage = LocalStorage(config.storage_path)
         
-        metrics = storage.get_repository_metrics(repository_filter=repository)
+        metrics = _load_cached_metrics(config) if repository is None else None
+        if metrics is None:
+            storage = LocalStorage(config.storage_path)
+            metrics = storage.get_repository_metrics(repository_filter=repository)
         
         if format == "table":
             _display_table_report(metrics)
         elif format == "json":
-            import json
-            click.echo(json.dumps(metrics, indent=2, default=str))
+            _echo_json(metrics)
         elif format == "csv":
             _display_csv_report(metrics)
             
@@ -143,38 +414,95 @@ def report(format: str, repository: Optional[str]) -> None:
         sys.exit(1)
 
 
+def _echo_json(data: Any) -> None:
+    """Print data as indented JSON, using orjson when it is installed.
+    
+    The two encoders differ on non-ASCII text: orjson writes raw UTF-8 while
+    the json fallback escapes it as \\uXXXX. Both parse to the same data.
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+        
+        click.echo(json.dumps(data, indent=2, default=str))
+        return
+        
+    option = (
+        orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+    click.echo(orjson.dumps(data, default=str, option=option))
+
+
 def _display_table_report(metrics: dict) -> None:
-    """Display metrics in a table format."""
-    table = Table(title="Claude Code Metrics Summary")
+    """Display metrics in a table format.
     
-    table.add_column("Repository", style="cyan")
-    table.add_column("Conversations", justify="right")
-    table.add_column("Errors", justify="right", style="red")
-    table.add_column("Tool Usage", justify="right", style="green")
-    table.add_column("Last Activity", style="dim")
+    When stdout is not a terminal the rows are written as plain tab-separated
+    text, skipping Rich layout and rendering entirely.
+    """
+    rows = _report_rows(metrics, missing_activity="N/A")
     
-    for repo, data in metrics.items():
-        table.add_row(
-            repo,
-            str(data.get("conversation_count", 0)),
-            str(data.get("error_count", 0)),
-            str(data.get("tool_usage_count", 0)),
-            str(data.get("last_activity", "N/A"))
-        )
+    if not sys.stdout.isatty():
+        sys.stdout.write("\t".join(_REPORT_HEADERS) + "\n")
+        sys.stdout.writelines("\t".join(map(str, row)) + "\n" for row in rows)
+        return
+        
+    table = _make_table()
+    for row in rows:
+        table.add_row(*map(str, row))
+    
+    _console().print(table, soft_wrap=True)
+
+
+def _make_table() -> "Table":
+    """Build the empty metrics summary table with its columns."""
+    from rich.table import Table
+    
+    table = Table(title="Claude Code Metrics Summary")
+    
+    for header, options in zip(_REPORT_HEADERS, _REPORT_COLUMN_OPTIONS, strict=True):
+        table.add_column(header, **options)
     
-    console.print(table)
+    return table
 
 
 def _display_csv_report(metrics: dict) -> None:
     """Display metrics in CSV format."""
-    click.echo("repository,conversations,errors,tool_usage,last_activity")
+    import csv
+    
+    writer = csv.writer(sys.stdout, lineterminator="\n")
+    writer.writerow(
+        ["repository", "conversations", "errors", "tool_usage", "last_activity"]
+    )
+    writer.writerows(_report_rows(metrics, missing_activity=""))
+
+
+def _report_rows(metrics: dict, missing_activity: str) -> Iterator[tuple]:
+    """Yield (repository, conversations, errors, tool_usage, last_activity) rows.
+    
+    Complete rows go through a single itemgetter call; rows missing a column
+    fall back to per-key defaults.
+    """
     for repo, data in metrics.items():
-        click.echo(f"{repo},{data.get('conversation_count', 0)},{data.get('error_count', 0)},{data.get('tool_usage_count', 0)},{data.get('last_activity', '')}")
+        try:
+            yield (repo, *_REPORT_ROW(data))
+        except KeyError:
+            yield (
+                repo,
+                data.get("conversation_count", 0),
+                data.get("error_count", 0),
+                data.get("tool_usage_count", 0),
+                data.get("last_activity", missing_activity),
+            )
 
 
 @cli.command()
 def status() -> None:
     """Show claude-metrics status."""
+    from .config import Config
+    from .storage import LocalStorage
+    
+    console = _console()
     try:
         config = Config.load()
         storage = LocalStorage(config.storage_path)
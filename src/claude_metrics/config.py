@@ -1,13 +1,68 @@
 """Configuration management for claude-metrics."""
 
+import json
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 import yaml
-from pydantic import BaseModel
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
 
-class Config(BaseModel):
+# Resolved once at import; Path.home() goes through expanduser on every call
+_DEFAULT_CONFIG_DIR = Path.home() / ".claude-metrics"
+_DEFAULT_CLAUDE_PROJECTS_PATH = Path.home() / ".claude" / "projects"
+
+# Written verbatim by Config.create_default; this is the single source of the
+# default pattern library.
+_DEFAULT_CONFIG_YAML = r"""data_sources:
+  claude_projects_path: {claude_projects_path}
+  scan_interval: {scan_interval}
+storage:
+  type: sqlite
+  path: {storage_path}
+patterns:
+  error_detection:
+  - name: test_failures
+    regex: '\b(test\s+fail|assertion\s+error|test.*failed)\b'
+    weight: 80
+  - name: build_errors
+    regex: '\b(build\s+fail|compilation\s+error|cannot\s+build)\b'
+    weight: 85
+  - name: runtime_errors
+    regex: '\b(error|exception|traceback|stack\s+trace)\b'
+    weight: 75
+  code_quality:
+  - name: quick_fixes
+    regex: '\b(quick\s+fix|hack|workaround|temporary)\b'
+    weight: 60
+  - name: todo_items
+    regex: '\b(todo|fixme|hack|temporary)\b'
+    weight: 40
+  tool_usage:
+  - name: file_operations
+    regex: '\b(read|write|edit|create)\s+(file|directory)\b'
+    weight: 30
+  - name: git_operations
+    regex: '\b(git\s+commit|git\s+push|git\s+merge|git\s+branch)\b'
+    weight: 50
+  - name: testing
+    regex: '\b(run\s+test|pytest|npm\s+test|test\s+suite)\b'
+    weight: 70
+"""
+
+
+def _read_config_file(config_file: Path) -> dict:
+    """Parse a config.yaml file."""
+    with open(config_file) as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+@dataclass(slots=True)
+class Config:
     """Configuration settings for claude-metrics."""
     
     config_dir: Path
@@ -15,18 +70,21 @@ class Config(BaseModel):
     storage_path: Path
     scan_interval: str = "5m"
     
+    # Parsed config.yaml contents, kept so get_patterns() doesn't re-read the file
+    _raw: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    
     @classmethod
     def create_default(cls, config_dir: Optional[str] = None) -> "Config":
         """Create default configuration and save to disk."""
         if config_dir is None:
-            config_dir = Path.home() / ".claude-metrics"
+            config_dir = _DEFAULT_CONFIG_DIR
         else:
             config_dir = Path(config_dir)
             
         config_dir.mkdir(exist_ok=True, parents=True)
         
         # Default Claude Code projects path
-        claude_projects_path = Path.home() / ".claude" / "projects"
+        claude_projects_path = _DEFAULT_CLAUDE_PROJECTS_PATH
         storage_path = config_dir / "metrics.db"
         
         config = cls(
@@ -37,75 +95,22 @@ class Config(BaseModel):
         
         # Save configuration
         config_file = config_dir / "config.yaml"
-        config_data = {
-            "data_sources": {
-                "claude_projects_path": str(claude_projects_path),
-                "scan_interval": config.scan_interval,
-            },
-            "storage": {
-                "type": "sqlite",
-                "path": str(storage_path),
-            },
-            "patterns": {
-                "error_detection": [
-                    {
-                        "name": "test_failures",
-                        "regex": r"\b(test\s+fail|assertion\s+error|test.*failed)\b",
-                        "weight": 80,
-                    },
-                    {
-                        "name": "build_errors", 
-                        "regex": r"\b(build\s+fail|compilation\s+error|cannot\s+build)\b",
-                        "weight": 85,
-                    },
-                    {
-                        "name": "runtime_errors",
-                        "regex": r"\b(error|exception|traceback|stack\s+trace)\b",
-                        "weight": 75,
-                    },
-                ],
-                "code_quality": [
-                    {
-                        "name": "quick_fixes",
-                        "regex": r"\b(quick\s+fix|hack|workaround|temporary)\b",
-                        "weight": 60,
-                    },
-                    {
-                        "name": "todo_items",
-                        "regex": r"\b(todo|fixme|hack|temporary)\b",
-                        "weight": 40,
-                    },
-                ],
-                "tool_usage": [
-                    {
-                        "name": "file_operations",
-                        "regex": r"\b(read|write|edit|create)\s+(file|directory)\b",
-                        "weight": 30,
-                    },
-                    {
-                        "name": "git_operations", 
-                        "regex": r"\b(git\s+commit|git\s+push|git\s+merge|git\s+branch)\b",
-                        "weight": 50,
-                    },
-                    {
-                        "name": "testing",
-                        "regex": r"\b(run\s+test|pytest|npm\s+test|test\s+suite)\b",
-                        "weight": 70,
-                    },
-                ],
-            },
-        }
+        config_file.write_text(
+            _DEFAULT_CONFIG_YAML.format(
+                # JSON strings are valid double-quoted YAML scalars
+                claude_projects_path=json.dumps(str(claude_projects_path)),
+                scan_interval=json.dumps(config.scan_interval),
+                storage_path=json.dumps(str(storage_path)),
+            )
+        )
         
-        with open(config_file, "w") as f:
-            yaml.dump(config_data, f, default_flow_style=False)
-            
         return config
     
     @classmethod
     def load(cls, config_dir: Optional[str] = None) -> "Config":
         """Load configuration from disk."""
         if config_dir is None:
-            config_dir = Path.home() / ".claude-metrics"
+            config_dir = _DEFAULT_CONFIG_DIR
         else:
             config_dir = Path(config_dir)
             
@@ -114,24 +119,21 @@ class Config(BaseModel):
         if not config_file.exists():
             raise FileNotFoundError(f"Configuration not found at {config_file}")
             
-        with open(config_file) as f:
-            config_data = yaml.safe_load(f)
-            
+        config_data = _read_config_file(config_file)
         claude_projects_path = Path(config_data["data_sources"]["claude_projects_path"])
         storage_path = Path(config_data["storage"]["path"])
         
-        return cls(
+        config = cls(
             config_dir=config_dir,
             claude_projects_path=claude_projects_path,
             storage_path=storage_path,
             scan_interval=config_data["data_sources"].get("scan_interval", "5m"),
         )
+        config._raw = config_data
+        return config
     
     def get_patterns(self) -> dict:
-        """Load patterns from configuration file."""
-        config_file = self.config_dir / "config.yaml"
-        
-        with open(config_file) as f:
-            config_data = yaml.safe_load(f)
-            
-        return config_data.get("patterns", {})
\ No newline at end of file
+        """Return patterns from the configuration file, parsing it at most once."""
+        if self._raw is None:
+            self._raw = _read_config_file(self.config_dir / "config.yaml")
+        return self._raw.get("patterns", {})
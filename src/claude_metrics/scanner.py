@@ -1,14 +1,55 @@
 """Scanner for Claude Code conversation files."""
 
-import json
-import re
+import mmap
+import os
+import sys
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Iterator
-from pydantic import BaseModel
+from typing import Any, Callable, Iterator, List, Optional, Union
 
+import msgspec
 
-class ConversationMessage(BaseModel):
+
+class _MessagePayload(msgspec.Struct):
+    """The ``message`` object of a JSONL line; only plain-text content is supported."""
+    
+    content: str = ""
+
+
+class _JsonlRecord(msgspec.Struct):
+    """On-disk shape of a conversation JSONL line (only the fields we read)."""
+    
+    session_id: str = msgspec.field(default="", name="sessionId")
+    timestamp: Any = ""
+    message_type: str = msgspec.field(default="", name="type")
+    message: _MessagePayload = msgspec.field(default_factory=_MessagePayload)
+    cwd: Optional[str] = None
+    git_branch: Optional[str] = msgspec.field(default=None, name="gitBranch")
+
+
+class _CwdRecord(msgspec.Struct):
+    """Just the working directory of a JSONL line."""
+    
+    cwd: Optional[str] = None
+
+
+# Units accepted by ConversationScanner._parse_since; "m" is an approximate month
+_SINCE_UNITS = {
+    "d": timedelta(days=1),
+    "w": timedelta(weeks=1),
+    "m": timedelta(days=30),
+}
+
+
+# Schema-aware decoders: validate and fill the Structs directly from JSON
+_RECORD_DECODER = msgspec.json.Decoder(_JsonlRecord)
+_CWD_DECODER = msgspec.json.Decoder(_CwdRecord)
+
+
+@dataclass(slots=True)
+class ConversationMessage:
     """A single message in a Claude Code conversation."""
     
     session_id: str
@@ -19,45 +60,44 @@ class ConversationMessage(BaseModel):
     git_branch: Optional[str] = None
     
     @classmethod
-    def from_jsonl_line(cls, line: str) -> Optional["ConversationMessage"]:
-        """Parse a JSONL line into a ConversationMessage."""
+    def from_jsonl_line(
+        cls, line: Union[str, bytes]
+    ) -> Optional["ConversationMessage"]:
+        """Parse a JSONL line (str or UTF-8 bytes) into a ConversationMessage."""
         try:
-            data = json.loads(line.strip())
-            
-            # Extract basic fields
-            session_id = data.get("sessionId", "")
-            timestamp_str = data.get("timestamp", "")
-            message_type = data.get("type", "")
-            
-            # Parse timestamp
-            try:
-                timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-            except (ValueError, AttributeError):
-                timestamp = datetime.now()
-            
-            # Extract message content
-            message_data = data.get("message", {})
-            content = message_data.get("content", "")
-            
-            # Extract metadata
-            cwd = data.get("cwd")
-            git_branch = data.get("gitBranch")
+            # Surrounding whitespace and the trailing newline are valid JSON
+            record = _RECORD_DECODER.decode(line)
+        except msgspec.DecodeError:
+            # Skip malformed lines (including schema mismatches)
+            return None
             
-            return cls(
-                session_id=session_id,
-                timestamp=timestamp,
-                message_type=message_type,
-                content=content,
-                cwd=cwd,
-                git_branch=git_branch,
-            )
+        # Parse timestamp; fromisoformat accepts a trailing "Z" on Python 3.11+
+        try:
+            timestamp = datetime.fromisoformat(record.timestamp)
+        except (ValueError, TypeError):
+            timestamp = datetime.now()
+        
+        # These repeat on every line of a file (and across files); interning
+        # makes all messages share one string object per distinct value.
+        cwd = record.cwd
+        if cwd:
+            cwd = sys.intern(cwd)
+        git_branch = record.git_branch
+        if git_branch:
+            git_branch = sys.intern(git_branch)
             
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
-            # Skip malformed lines
-            return None
+        return cls(
+            session_id=sys.intern(record.session_id),
+            timestamp=timestamp,
+            message_type=sys.intern(record.message_type),
+            content=record.message.content,
+            cwd=cwd,
+            git_branch=git_branch,
+        )
 
 
-class Conversation(BaseModel):
+@dataclass(slots=True)
+class Conversation:
     """A complete conversation with metadata."""
     
     session_id: str
@@ -81,6 +121,108 @@ class Conversation(BaseModel):
         return Path(self.repository_path).name
 
 
+def _read_conversation_file(file_path: str) -> Optional[Conversation]:
+    """Parse a single conversation file."""
+    messages = []
+    repository_path = None
+    git_branch = None
+    start_time = end_time = None
+    
+    try:
+        with open(file_path, 'rb') as f:
+            # mmap can't map an empty file
+            if not os.fstat(f.fileno()).st_size:
+                return None
+                
+            # Hand raw bytes to the decoder; no per-line UTF-8 decode into str
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line in iter(mm.readline, b""):
+                    if line.isspace():
+                        continue
+                    message = ConversationMessage.from_jsonl_line(line)
+                    if not message:
+                        continue
+                    messages.append(message)
+                    
+                    # Collect conversation metadata in the same pass
+                    if message.cwd and not repository_path:
+                        repository_path = message.cwd
+                    if message.git_branch and not git_branch:
+                        git_branch = message.git_branch
+                    if start_time is None:
+                        start_time = end_time = message.timestamp
+                    elif message.timestamp < start_time:
+                        start_time = message.timestamp
+                    elif message.timestamp > end_time:
+                        end_time = message.timestamp
+                        
+    except (IOError, UnicodeDecodeError):
+        return None
+        
+    if not messages:
+        return None
+        
+    return Conversation(
+        session_id=messages[0].session_id,
+        repository_path=repository_path,
+        git_branch=git_branch,
+        start_time=start_time,
+        end_time=end_time,
+        message_count=len(messages),
+        messages=messages,
+    )
+
+
+def load_conversation(
+    file_path: str,
+    cutoff_time: Optional[datetime] = None,
+    repository_filter: Optional[str] = None,
+) -> Optional[Conversation]:
+    """Parse a conversation file and apply the scan filters.
+    
+    Returns None for files that can't be parsed or don't pass the filters.
+    Module-level so it can run in ProcessPoolExecutor workers.
+    """
+    try:
+        conversation = _read_conversation_file(file_path)
+        if not conversation:
+            return None
+            
+        # Apply filters
+        if cutoff_time and conversation.start_time < cutoff_time:
+            return None
+            
+        if repository_filter and repository_filter not in str(conversation.repository_path or ""):
+            return None
+            
+    except Exception:
+        # Skip files that can't be parsed or whose metadata can't be compared
+        return None
+        
+    return conversation
+
+
+def _read_repository_path(file_path: str) -> Optional[str]:
+    """Return the first cwd recorded in a conversation file, reading no further."""
+    try:
+        with open(file_path, 'rb') as f:
+            for line in f:
+                # Cheap substring test before decoding anything
+                if b'"cwd"' not in line:
+                    continue
+                try:
+                    cwd = _CWD_DECODER.decode(line).cwd
+                except (msgspec.DecodeError, UnicodeDecodeError):
+                    continue
+                if cwd:
+                    return cwd
+                    
+    except IOError:
+        pass
+        
+    return None
+
+
 class ConversationScanner:
     """Scanner for Claude Code conversation files."""
     
@@ -91,115 +233,89 @@ class ConversationScanner:
         self,
         repository_filter: Optional[str] = None,
         since: str = "7d",
-    ) -> List[Conversation]:
-        """Scan and parse Claude Code conversations."""
-        if not self.claude_projects_path.exists():
-            return []
-            
-        # Parse since parameter
-        cutoff_time = self._parse_since(since)
+    ) -> Iterator[Conversation]:
+        """Scan and parse Claude Code conversations, yielding them as they are read.
         
-        conversations = []
+        Conversations are produced in file discovery order, not sorted by time.
+        """
+        load = self.conversation_loader(
+            repository_filter=repository_filter,
+            since=since,
+        )
+        for file_path in self.iter_conversation_files():
+            conversation = load(file_path)
+            if conversation:
+                yield conversation
+    
+    def conversation_loader(
+        self,
+        repository_filter: Optional[str] = None,
+        since: str = "7d",
+    ) -> Callable[[str], Optional[Conversation]]:
+        """Return a picklable per-file loader with the given scan filters applied.
         
-        # Iterate through project directories
-        for project_dir in self.claude_projects_path.iterdir():
-            if not project_dir.is_dir():
-                continue
-                
-            # Each project directory contains .jsonl files
-            for jsonl_file in project_dir.glob("*.jsonl"):
-                try:
-                    conversation = self._parse_conversation_file(jsonl_file)
-                    if conversation:
-                        # Apply filters
-                        if cutoff_time and conversation.start_time < cutoff_time:
-                            continue
-                            
-                        if repository_filter and repository_filter not in str(conversation.repository_path or ""):
-                            continue
-                            
-                        conversations.append(conversation)
-                        
-                except Exception as e:
-                    # Skip files that can't be parsed
-                    continue
-                    
-        return sorted(conversations, key=lambda c: c.start_time, reverse=True)
+        Lets callers fan file loading out to a process pool themselves.
+        """
+        return partial(
+            load_conversation,
+            cutoff_time=self._parse_since(since),
+            repository_filter=repository_filter,
+        )
     
-    def _parse_conversation_file(self, file_path: Path) -> Optional[Conversation]:
-        """Parse a single conversation file."""
-        messages = []
+    def iter_conversation_files(self) -> Iterator[str]:
+        """Yield the path of every .jsonl file directly under a project directory.
         
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if line.strip():
-                        message = ConversationMessage.from_jsonl_line(line)
-                        if message:
-                            messages.append(message)
-                            
-        except (IOError, UnicodeDecodeError):
-            return None
-            
-        if not messages:
-            return None
+        Uses os.scandir so directory and file type checks come from the cached
+        directory entry instead of a stat() per path. Paths are plain strings;
+        nothing downstream needs a Path object.
+        """
+        if not self.claude_projects_path.exists():
+            return
             
-        # Extract conversation metadata
-        session_id = messages[0].session_id
-        repository_path = None
-        git_branch = None
-        
-        # Find repository path and branch from messages
-        for message in messages:
-            if message.cwd and not repository_path:
-                repository_path = message.cwd
-            if message.git_branch and not git_branch:
-                git_branch = message.git_branch
-                
-        start_time = min(msg.timestamp for msg in messages)
-        end_time = max(msg.timestamp for msg in messages)
-        
-        return Conversation(
-            session_id=session_id,
-            repository_path=repository_path,
-            git_branch=git_branch,
-            start_time=start_time,
-            end_time=end_time,
-            message_count=len(messages),
-            messages=messages,
-        )
+        with os.scandir(self.claude_projects_path) as projects:
+            for project_dir in projects:
+                if not project_dir.is_dir():
+                    continue
+                    
+                # Each project directory contains .jsonl files
+                try:
+                    with os.scandir(project_dir.path) as entries:
+                        jsonl_files = [
+                            entry.path
+                            for entry in entries
+                            if entry.name.endswith(".jsonl") and entry.is_file()
+                        ]
+                except OSError:
+                    # Unreadable project directory
+                    continue
+                    
+                yield from jsonl_files
     
     def _parse_since(self, since: str) -> Optional[datetime]:
-        """Parse 'since' parameter into datetime."""
+        """Parse 'since' parameter (e.g. 7d, 2w, 1m) into datetime."""
         if not since:
             return None
             
-        # Extract number and unit
-        match = re.match(r"(\d+)([dwm])", since.lower())
-        if not match:
+        # Leading digits followed by a unit letter; anything after is ignored
+        since = since.lower()
+        i = 0
+        while i < len(since) and since[i].isdecimal():
+            i += 1
+        if i == 0 or i == len(since) or since[i] not in _SINCE_UNITS:
             return None
             
-        amount = int(match.group(1))
-        unit = match.group(2)
-        
-        now = datetime.now()
-        
-        if unit == "d":
-            return now - timedelta(days=amount)
-        elif unit == "w":
-            return now - timedelta(weeks=amount)
-        elif unit == "m":
-            return now - timedelta(days=amount * 30)  # Approximate
-            
-        return None
+        return datetime.now() - int(since[:i]) * _SINCE_UNITS[since[i]]
     
     def get_repository_list(self) -> List[str]:
-        """Get list of unique repositories from conversations."""
-        repositories = set()
+        """Get list of unique repositories from conversation files.
         
-        conversations = self.scan_conversations()
-        for conversation in conversations:
-            if conversation.repository_path:
-                repositories.add(conversation.repository_path)
+        Reads each file only up to its first recorded cwd instead of parsing
+        whole conversations.
+        """
+        repositories = set()
+        for jsonl_file in self.iter_conversation_files():
+            repository_path = _read_repository_path(jsonl_file)
+            if repository_path:
+                repositories.add(repository_path)
                 
-        return sorted(list(repositories))
\ No newline at end of file
+        return sorted(repositories)
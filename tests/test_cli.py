@@ -0,0 +1,121 @@
+"""Tests for cli helpers: bounded pooled mapping and the metrics snapshot."""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from claude_metrics.cli import (
+    _load_cached_metrics,
+    _map_bounded,
+    _save_cached_metrics,
+)
+from claude_metrics.config import Config
+
+METRICS = {"repo": {"conversation_count": 3, "error_count": 1}}
+
+
+class _CountingExecutor:
+    """Runs tasks inline and tracks how many results haven't been collected."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def submit(self, fn, item):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return _CountedResult(self, fn(item))
+
+
+class _CountedResult:
+    def __init__(self, executor, value):
+        self._executor = executor
+        self._value = value
+
+    def result(self):
+        self._executor.in_flight -= 1
+        return self._value
+
+
+def test_map_bounded_keeps_input_order():
+    def slow_square(n):
+        time.sleep((10 - n) / 1000)
+        return n * n
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(_map_bounded(executor, slow_square, range(10), window=4))
+
+    assert results == [(n, n * n) for n in range(10)]
+
+
+@pytest.mark.parametrize("window", [1, 3, 8])
+def test_map_bounded_limits_tasks_in_flight(window):
+    executor = _CountingExecutor()
+    results = list(_map_bounded(executor, str, range(20), window=window))
+
+    assert results == [(n, str(n)) for n in range(20)]
+    assert executor.max_in_flight == window
+    assert executor.in_flight == 0
+
+
+@pytest.fixture
+def config(tmp_path):
+    storage_path = tmp_path / "metrics.db"
+    storage_path.write_bytes(b"db")
+    return Config(
+        config_dir=tmp_path,
+        claude_projects_path=tmp_path / "projects",
+        storage_path=storage_path,
+    )
+
+
+def test_round_trip(config):
+    _save_cached_metrics(config, METRICS)
+    assert _load_cached_metrics(config) == METRICS
+
+
+def test_missing_snapshot(config):
+    assert _load_cached_metrics(config) is None
+
+
+def test_missing_database_is_stale(config):
+    _save_cached_metrics(config, METRICS)
+    config.storage_path.unlink()
+    assert _load_cached_metrics(config) is None
+
+
+def test_no_snapshot_without_database(config):
+    config.storage_path.unlink()
+    _save_cached_metrics(config, METRICS)
+    config.storage_path.write_bytes(b"db")
+    assert _load_cached_metrics(config) is None
+
+
+def test_database_size_change_is_stale(config):
+    _save_cached_metrics(config, METRICS)
+    config.storage_path.write_bytes(b"db grown")
+    assert _load_cached_metrics(config) is None
+
+
+def test_database_mtime_change_is_stale(config):
+    _save_cached_metrics(config, METRICS)
+    st = config.storage_path.stat()
+    os.utime(config.storage_path, ns=(st.st_atime_ns, st.st_mtime_ns - 1))
+    assert _load_cached_metrics(config) is None
+
+
+def test_wal_appearing_is_stale(config):
+    _save_cached_metrics(config, METRICS)
+    config.storage_path.with_name("metrics.db-wal").write_bytes(b"wal")
+    assert _load_cached_metrics(config) is None
+
+
+def test_different_storage_path_is_stale(config, tmp_path):
+    _save_cached_metrics(config, METRICS)
+    other_path = tmp_path / "other.db"
+    other_path.write_bytes(b"db")
+    os.utime(other_path, ns=(0, config.storage_path.stat().st_mtime_ns))
+    config.storage_path = other_path
+    assert _load_cached_metrics(config) is None
@@ -0,0 +1,84 @@
+"""Tests for conversation file parsing and the --since filter."""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from claude_metrics.scanner import ConversationScanner, _read_conversation_file
+
+
+def _line(timestamp, content="hi", **fields):
+    record = {
+        "sessionId": "s1",
+        "timestamp": timestamp,
+        "type": "user",
+        "message": {"role": "user", "content": content},
+        **fields,
+    }
+    return json.dumps(record) + "\n"
+
+
+@pytest.mark.parametrize(
+    ("since", "expected"),
+    [
+        ("7d", timedelta(days=7)),
+        ("2w", timedelta(weeks=2)),
+        ("1m", timedelta(days=30)),
+        ("7days", timedelta(days=7)),
+    ],
+)
+def test_parse_since(since, expected):
+    before = datetime.now()
+    cutoff = ConversationScanner("/nonexistent")._parse_since(since)
+    after = datetime.now()
+    assert before - expected <= cutoff <= after - expected
+
+
+@pytest.mark.parametrize("since", ["x", "", "5"])
+def test_parse_since_invalid(since):
+    assert ConversationScanner("/nonexistent")._parse_since(since) is None
+
+
+def test_read_empty_file(tmp_path):
+    path = tmp_path / "empty.jsonl"
+    path.write_bytes(b"")
+    assert _read_conversation_file(str(path)) is None
+
+
+def test_read_skips_blank_and_malformed_lines(tmp_path):
+    path = tmp_path / "conv.jsonl"
+    path.write_text(
+        "\n"
+        + _line("2026-10-01T10:00:00", cwd="/work/repo", gitBranch="main")
+        + "   \n"
+        + "{not json\n"
+        + _line("2026-10-01T10:05:00")
+    )
+    conversation = _read_conversation_file(str(path))
+
+    assert conversation.message_count == 2
+    assert [m.content for m in conversation.messages] == ["hi", "hi"]
+    assert conversation.repository_path == "/work/repo"
+    assert conversation.git_branch == "main"
+
+
+def test_read_only_malformed_lines(tmp_path):
+    path = tmp_path / "conv.jsonl"
+    path.write_text("{not json\n\n")
+    assert _read_conversation_file(str(path)) is None
+
+
+def test_read_out_of_order_timestamps(tmp_path):
+    path = tmp_path / "conv.jsonl"
+    path.write_text(
+        _line("2026-10-01T10:30:00")
+        + _line("2026-10-01T10:00:00")
+        + _line("2026-10-01T11:00:00")
+        + _line("2026-10-01T10:45:00")
+    )
+    conversation = _read_conversation_file(str(path))
+
+    assert conversation.start_time == datetime(2026, 10, 1, 10, 0)
+    assert conversation.end_time == datetime(2026, 10, 1, 11, 0)
+    assert conversation.duration_minutes == 60